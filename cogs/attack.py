@@ -11,7 +11,8 @@ import discord
 from discord.ext import commands
 from discord.ext.commands import Bot, Context
 
-from lib.roll import roll_attack, roll_damage, calculate_crit_damage, AttackType
+from lib.roll import AttackType
+from lib.roll_batch import roll_attacks_batch, warmup_jit
 from lib.settings import (
     CREATURES,
     STANDARD_ATTACK_COMMAND,
@@ -26,16 +27,23 @@ ActionDict = dict[str, Any]
 # Maximum number of attack results to display in embed (prevents message overflow)
 DISPLAY_LIMIT: int = 10
 
-# Critical roll values for d20
-CRITICAL_HIT_ROLL: int = 20
-CRITICAL_MISS_ROLL: int = 1
+# Status label and color indicator per outcome code from the batched
+# roller (0 miss, 1 hit, 2 crit, 3 crit fail) - constant tuples replace
+# the per-attack branch chain in the display loop
+_STATUS: tuple[tuple[str, str], ...] = (
+    ("❌ Miss", "⚪"),
+    ("✅ Hit", "🟢"),
+    ("🎯 **CRITICAL HIT!**", "🟡"),
+    ("💥 **CRITICAL FAIL!**", "🔴"),
+)
 
-# Valid attack type commands
-VALID_ATTACK_TYPES: set[str] = {
+# Valid attack type commands (frozenset: smaller and faster to hash
+# against than a mutable set, with interned members from settings)
+VALID_ATTACK_TYPES: frozenset[str] = frozenset({
     STANDARD_ATTACK_COMMAND,
     ADVANTAGE_ATTACK_COMMAND,
     DISADVANTAGE_ATTACK_COMMAND,
-}
+})
 
 
 class AttackCog(commands.Cog):
@@ -59,6 +67,10 @@ class AttackCog(commands.Cog):
         """
         self.bot: Bot = bot
 
+        # Compile the Numba attack kernel now so the first !attack
+        # command doesn't pay the JIT latency (no-op without numba)
+        warmup_jit()
+
     @commands.command(
         name="attack",
         help="Roll attacks for multiple creatures against a target AC.\n"
@@ -111,17 +123,19 @@ class AttackCog(commands.Cog):
         # Look up creature data (case-insensitive)
         creature: CreatureDict = creatures[creature_name.lower()]
 
-        # Determine which action to use for the attack
+        # Determine which action to use for the attack (case-insensitive
+        # via the lowercase index precomputed at settings load)
         if action_name:
             # Validate specified action exists for this creature
-            if action_name not in creature["actions"]:
+            action_key: str = action_name.lower()
+            if action_key not in creature["_actions_lower"]:
                 available_actions: str = ", ".join(creature["actions"].keys())
                 await ctx.send(
                     f"❌ Action '{action_name}' not found for {creature_name}. "
                     f"Available: {available_actions}."
                 )
                 return
-            action: ActionDict = creature["actions"][action_name]
+            action: ActionDict = creature["_actions_lower"][action_key]
             action_display: str = action_name
         else:
             # Use creature's default action if none specified
@@ -129,71 +143,34 @@ class AttackCog(commands.Cog):
             action = creature["actions"][action_name]
             action_display = action_name
 
-        # Initialize tracking variables for results
-        results: list[dict[str, Any]] = []
-        total_damage: int = 0
-        hits: int = 0
+        # Roll every attack in one vectorized batch (one RNG call per die type)
+        dmg_count: int
+        dmg_sides: int
+        dmg_bonus: int
+        dmg_count, dmg_sides, dmg_bonus = action["_dmg"]
+        max_damage: int = action["_max_damage"]
+        batch: dict[str, Any] = roll_attacks_batch(
+            num_creatures,
+            action["attack_bonus"],
+            attack_type,
+            dmg_count,
+            dmg_sides,
+            dmg_bonus,
+            target_ac,
+            max_damage,
+        )
 
-        # Roll attacks for each creature
-        for i in range(num_creatures):
-            # Roll the attack using the action's attack bonus
-            nat_roll, attack_total, dice = roll_attack(
-                action["attack_bonus"], attack_type
-            )
+        # Tally hits and total damage with C-level array reductions
+        hits: int = int(batch["hit"].sum())
+        total_damage: int = int(batch["damage"].sum())
 
-            # Build result dictionary for this attack
-            result: dict[str, Any] = {
-                "num": i + 1,
-                "nat_roll": nat_roll,
-                "dice": dice,
-                "total": attack_total,
-                "hit": False,
-                "crit": False,
-                "crit_fail": False,
-                "damage": 0,
-                "breakdown": "",
-            }
-
-            # Determine attack outcome
-            if nat_roll == CRITICAL_MISS_ROLL:
-                # Natural 1: Critical failure (auto-miss)
-                result["crit_fail"] = True
-            elif nat_roll == CRITICAL_HIT_ROLL:
-                # Natural 20: Critical hit (auto-hit with bonus damage)
-                result["crit"] = True
-                result["hit"] = True
-                hits += 1
-
-                # Calculate critical damage (max + extra roll)
-                dmg, breakdown = calculate_crit_damage(
-                    action["damage"]["count"],
-                    action["damage"]["sides"],
-                    action["damage"]["bonus"],
-                )
-                result["damage"] = dmg
-                result["breakdown"] = breakdown
-                total_damage += dmg
-            elif attack_total >= target_ac:
-                # Normal hit: attack total meets or exceeds AC
-                result["hit"] = True
-                hits += 1
-
-                # Roll normal damage
-                dmg, rolls = roll_damage(
-                    action["damage"]["count"],
-                    action["damage"]["sides"],
-                    action["damage"]["bonus"],
-                )
-                result["damage"] = dmg
+        # Precompute per-command formatting fragments once, outside the loop
+        bonus_str: str = f"+{dmg_bonus}" if dmg_bonus > 0 else ""
+        attack_bonus_str: str = f" + {action['attack_bonus']}"
 
-                # Format damage breakdown string
-                rolls_str: str = "+".join(map(str, rolls))
-                bonus: int = action["damage"]["bonus"]
-                bonus_str: str = f"+{bonus}" if bonus > 0 else ""
-                result["breakdown"] = f"{rolls_str}{bonus_str}"
-                total_damage += dmg
-
-            results.append(result)
+        # Resolve the attack-type check once: standard attacks never need
+        # the two-die display, so skip per-row length checks entirely
+        is_standard: bool = attack_type == STANDARD_ATTACK_COMMAND
 
         # Build Discord embed for displaying results
         embed: discord.Embed = discord.Embed(
@@ -206,51 +183,60 @@ class AttackCog(commands.Cog):
             color=discord.Color.purple(),
         )
 
-        # Add individual attack results (limited to prevent message overflow)
-        for r in results[:DISPLAY_LIMIT]:
-            # Determine status indicator based on roll outcome
-            if r["crit"]:
-                status: str = "🎯 **CRITICAL HIT!**"
-                color: str = "🟡"
-            elif r["crit_fail"]:
-                status = "💥 **CRITICAL FAIL!**"
-                color = "🔴"
-            elif r["hit"]:
-                status = "✅ Hit"
-                color = "🟢"
-            else:
-                status = "❌ Miss"
-                color = "⚪"
+        # Add individual attack results straight from the batch arrays
+        # (limited to prevent message overflow) - no intermediate result
+        # dicts are allocated, regardless of num_creatures
+        for i in range(min(num_creatures, DISPLAY_LIMIT)):
+            # Look up status indicator by outcome code (no branch chain)
+            status: str
+            color: str
+            status, color = _STATUS[int(batch["outcome"][i])]
 
             # Format dice display (show both dice for advantage/disadvantage)
-            if len(r["dice"]) > 1:
-                dice_str: str = f"[{', '.join(map(str, r['dice']))}]"
+            if not is_standard:
+                dice_str: str = f"[{', '.join(map(str, batch['dice'][i]))}]"
             else:
-                dice_str = str(r["nat_roll"])
+                dice_str = str(batch["nat_rolls"][i])
 
             # Build attack roll display string
             attack_str: str = (
-                f"{dice_str} + {action['attack_bonus']} = **{r['total']}**"
+                f"{dice_str}{attack_bonus_str} = **{int(batch['totals'][i])}**"
             )
 
             # Add damage info if the attack hit
             damage_str: str = ""
-            if r["hit"]:
-                damage_str = f"\n💥 Damage: **{r['damage']}** ({r['breakdown']})"
+            if batch["crit"][i]:
+                # Critical hit: max damage plus an extra roll of the dice
+                extra_rolls_str: str = "+".join(
+                    map(str, batch["crit_rolls"][i])
+                )
+                extra_total: int = int(batch["crit_rolls"][i].sum()) + dmg_bonus
+                damage_str = (
+                    f"\n💥 Damage: **{int(batch['damage'][i])}** "
+                    f"({max_damage} (max) + {extra_total} "
+                    f"({extra_rolls_str}{bonus_str}))"
+                )
+            elif batch["hit"][i]:
+                # Normal hit: the rolled damage dice plus flat bonus
+                rolls_str: str = "+".join(map(str, batch["damage_rolls"][i]))
+                damage_str = (
+                    f"\n💥 Damage: **{int(batch['damage'][i])}** "
+                    f"({rolls_str}{bonus_str})"
+                )
 
             # Add field for this attack result
             embed.add_field(
-                name=f"{color} {creature_name} #{r['num']} - {status}",
+                name=f"{color} {creature_name} #{i + 1} - {status}",
                 value=f"🎲 {attack_str}{damage_str}",
                 inline=False,
             )
 
         # Show truncation warning if there are more results than displayed
-        if len(results) > DISPLAY_LIMIT:
+        if num_creatures > DISPLAY_LIMIT:
             embed.add_field(
                 name="⚠️ Results Truncated",
                 value=(
-                    f"Showing {DISPLAY_LIMIT} of {len(results)} attacks. "
+                    f"Showing {DISPLAY_LIMIT} of {num_creatures} attacks. "
                     "See summary below."
                 ),
                 inline=False,
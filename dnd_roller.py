@@ -5,7 +5,6 @@ This module serves as the main entry point for the Discord bot, initializing
 the bot instance, loading cogs, and starting the connection to Discord.
 """
 
-import os
 from pathlib import Path
 
 import discord
@@ -16,6 +15,18 @@ from lib.settings import DISCORD_TOKEN, PREFIX
 # Directory containing cog extension modules
 COGS_DIR: Path = Path("cogs")
 
+# Cog module manifest, computed once at import so on_ready never touches
+# the filesystem (private modules prefixed with '_' are skipped)
+_COG_MODULES: tuple[str, ...] = tuple(
+    f"cogs.{path.stem}"
+    for path in COGS_DIR.glob("*.py")
+    if not path.stem.startswith("_")
+)
+
+# Sentinel guarding against duplicate loads: on_ready fires again on
+# reconnects, and reloading extensions raises ExtensionAlreadyLoaded
+_cogs_loaded: bool = False
+
 # Enable all Discord intents for full functionality
 INTENTS: discord.Intents = discord.Intents.all()
 
@@ -25,25 +36,31 @@ bot: Bot = Bot(command_prefix=PREFIX, intents=INTENTS)
 
 async def load_cogs() -> None:
     """
-    Dynamically load all cog extensions from the 'cogs/' directory.
+    Load all cog extensions from the precomputed module manifest.
 
     Each Python file in the cogs directory is treated as an extension module
     that adds specific functionality to the bot (e.g., attack commands, dice rolling).
+    The manifest is frozen at import time and a loaded flag makes repeat
+    calls (on_ready fires again after reconnects) no-ops.
 
     Raises:
         ExtensionError: If a cog fails to load due to syntax or import errors.
     """
+    global _cogs_loaded
+
+    # Skip reloading if the cogs were already loaded (e.g., on reconnect)
+    if _cogs_loaded:
+        return
+
     print("Loading cogs...")
 
-    # Iterate through all Python files in the cogs directory
-    for filename in os.listdir(COGS_DIR):
-        if filename.endswith(".py"):
-            # Extract module name by removing .py extension
-            module_name: str = filename[:-3]
+    # Iterate through the frozen module manifest
+    for module in _COG_MODULES:
+        # Load the extension using dot notation (cogs.module_name)
+        await bot.load_extension(module)
+        print(f"  ✓ {module.removeprefix('cogs.')} loaded successfully")
 
-            # Load the extension using dot notation (cogs.module_name)
-            await bot.load_extension(f"cogs.{module_name}")
-            print(f"  ✓ {module_name} loaded successfully")
+    _cogs_loaded = True
 
 
 @bot.event
@@ -9,11 +9,21 @@ import json
 from pathlib import Path
 from typing import Any
 
+# Prefer orjson's C parser (2-5x faster, lower memory) when installed;
+# fall back to the stdlib so environments without it still work
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def read(json_config: str) -> dict[str, Any]:
     """
     Read a JSON file and return its contents as a dictionary.
 
+    Uses orjson when available, parsing the raw bytes directly; otherwise
+    falls back to the stdlib json module.
+
     Args:
         json_config: Relative path to the JSON configuration file
                      from the current working directory.
@@ -23,17 +33,21 @@ def read(json_config: str) -> dict[str, Any]:
 
     Raises:
         FileNotFoundError: If the specified file does not exist.
-        json.JSONDecodeError: If the file contains invalid JSON.
+        ValueError: If the file contains invalid JSON.
 
     Example:
         >>> config = read("config/config.json")
         >>> print(config["commands"]["prefix"])
         '!'
     """
-    # Construct absolute path from current working directory
-    json_path: Path = Path.cwd() / json_config
+    # Relative paths resolve against the current working directory
+    json_path: Path = Path(json_config)
+
+    # Parse raw bytes with orjson when available (no text decode needed)
+    if orjson is not None:
+        return orjson.loads(json_path.read_bytes())
 
-    # Open and parse the JSON file
+    # Stdlib fallback: open in text mode and parse with json
     with json_path.open("r", encoding="utf-8") as file:
         data: dict[str, Any] = json.load(file)
 
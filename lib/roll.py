@@ -5,7 +5,7 @@ This module provides functions for rolling dice, calculating attack rolls,
 and determining damage for DnD 5e combat encounters.
 """
 
-from random import randint
+from random import Random
 from typing import Literal
 
 # Type alias for attack roll types (standard, advantage, or disadvantage)
@@ -16,6 +16,15 @@ CRITICAL_HIT: int = 20
 CRITICAL_MISS: int = 1
 D20_SIDES: int = 20
 
+# Module-level RNG with its randrange method bound once: skips the global
+# random module's singleton and per-call attribute lookups, and randrange
+# is faster than randint for the small ranges dice use
+_RNG: Random = Random()
+_randrange = _RNG.randrange
+
+# Upper bound for d20 randrange calls, precomputed (randrange excludes it)
+D20_SIDES_PLUS_ONE: int = 21
+
 
 def roll_die(sides: int) -> int:
     """
@@ -32,7 +41,20 @@ def roll_die(sides: int) -> int:
         >>> 1 <= roll <= 20
         True
     """
-    return randint(1, sides)
+    return _randrange(1, sides + 1)
+
+
+def _roll_d20() -> int:
+    """
+    Roll a d20 via the bound randrange with precomputed bounds.
+
+    Specialized for the hottest die: avoids the `sides + 1` addition and
+    argument passing that the generic `roll_die` pays per call.
+
+    Returns:
+        A random integer between 1 and 20 (inclusive).
+    """
+    return _randrange(1, D20_SIDES_PLUS_ONE)
 
 
 def roll_damage(count: int, sides: int, bonus: int) -> tuple[int, list[int]]:
@@ -57,8 +79,11 @@ def roll_damage(count: int, sides: int, bonus: int) -> tuple[int, list[int]]:
         >>> len(rolls) == 2
         True
     """
-    # Roll each die and collect results
-    rolls: list[int] = [roll_die(sides) for _ in range(count)]
+    # Roll each die and collect results, hoisting the bound method and
+    # upper bound out of the comprehension
+    rr = _randrange
+    upper: int = sides + 1
+    rolls: list[int] = [rr(1, upper) for _ in range(count)]
 
     # Calculate total: sum of rolls plus flat bonus
     return sum(rolls) + bonus, rolls
@@ -67,7 +92,7 @@ def roll_damage(count: int, sides: int, bonus: int) -> tuple[int, list[int]]:
 def roll_attack(
         attack_bonus: int,
         attack_type: AttackType
-) -> tuple[int, int, list[int]]:
+) -> tuple[int, int, tuple[int, ...]]:
     """
     Roll an attack with the given bonus and attack type.
 
@@ -83,22 +108,23 @@ def roll_attack(
         A tuple containing:
             - The selected d20 roll (after applying advantage/disadvantage).
             - The total attack value (selected roll + bonus).
-            - A list of all d20 rolls made (1 for standard, 2 for adv/disadv).
+            - A tuple of all d20 rolls made (1 for standard, 2 for adv/disadv);
+              tuples are cheaper to allocate than lists on this hot path.
 
     Example:
         >>> nat_roll, total, dice = roll_attack(5, "advantage")
         >>> total == nat_roll + 5
         True
     """
-    # Roll the first d20
-    roll1: int = roll_die(D20_SIDES)
+    # Roll the first d20 via the specialized d20 helper
+    roll1: int = _roll_d20()
 
     # For standard attacks, return the single roll immediately
     if attack_type == "standard":
-        return roll1, roll1 + attack_bonus, [roll1]
+        return roll1, roll1 + attack_bonus, (roll1,)
 
     # For advantage/disadvantage, roll a second d20
-    roll2: int = roll_die(D20_SIDES)
+    roll2: int = _roll_d20()
 
     # Select the appropriate roll based on attack type
     if attack_type == "advantage":
@@ -108,10 +134,15 @@ def roll_attack(
         # Disadvantage: take the lower of the two rolls
         selected = min(roll1, roll2)
 
-    return selected, selected + attack_bonus, [roll1, roll2]
+    return selected, selected + attack_bonus, (roll1, roll2)
 
 
-def calculate_crit_damage(count: int, sides: int, bonus: int) -> tuple[int, str]:
+def calculate_crit_damage(
+        count: int,
+        sides: int,
+        bonus: int,
+        precomputed_max: int | None = None,
+) -> tuple[int, str]:
     """
     Calculate critical hit damage using max damage + extra rolled damage.
 
@@ -122,6 +153,8 @@ def calculate_crit_damage(count: int, sides: int, bonus: int) -> tuple[int, str]
         count: The number of damage dice (e.g., 2 for 2d6).
         sides: The number of sides on each die (e.g., 6 for 2d6).
         bonus: A flat bonus to add to the damage (e.g., 3 for 2d6+3).
+        precomputed_max: Optional precomputed max damage (count * sides +
+                         bonus) to skip recomputing it on every crit.
 
     Returns:
         A tuple containing:
@@ -134,8 +167,12 @@ def calculate_crit_damage(count: int, sides: int, bonus: int) -> tuple[int, str]
         >>> "max" in breakdown
         True
     """
-    # Calculate maximum possible damage (all dice show max value)
-    max_damage: int = count * sides + bonus
+    # Maximum possible damage (all dice show max value), precomputed at
+    # settings load when available
+    max_damage: int = (
+        precomputed_max if precomputed_max is not None
+        else count * sides + bonus
+    )
 
     # Roll extra damage dice for the critical hit
     extra_total, extra_rolls = roll_damage(count, sides, bonus)
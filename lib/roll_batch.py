@@ -0,0 +1,199 @@
+"""
+Vectorized attack rolling utilities built on NumPy.
+
+This module batches every d20 and damage die for a multi-creature attack
+into a handful of C-level array operations, replacing the per-creature
+Python loop for the hot `!attack` path.
+"""
+
+from typing import Any
+
+import numpy as np
+
+from lib.roll import AttackType, CRITICAL_HIT, CRITICAL_MISS, D20_SIDES
+
+# Prefer the Numba-compiled kernel when available; fall back to pure NumPy
+try:
+    from lib.roll_numba import simulate as _simulate
+except ImportError:
+    _simulate = None
+
+# Shared generator for all batched rolls (one C-level RNG instance)
+rng: np.random.Generator = np.random.default_rng()
+
+# Integer modes for the compiled kernel (string compares become int compares)
+_ATTACK_TYPE_MODE: dict[str, int] = {
+    "standard": 0,
+    "advantage": 1,
+    "disadvantage": 2,
+}
+
+# Integer outcome codes per attack, usable as indexes into display tables
+OUTCOME_MISS: int = 0
+OUTCOME_HIT: int = 1
+OUTCOME_CRIT: int = 2
+OUTCOME_CRIT_FAIL: int = 3
+
+
+def warmup_jit() -> None:
+    """
+    Trigger Numba compilation of the attack kernel ahead of time.
+
+    Calling the compiled kernel once with trivial arguments pays the JIT
+    compile (or cache-load) latency at cog load instead of on the first
+    user command. A no-op when numba is not installed.
+    """
+    if _simulate is not None:
+        _simulate(1, 0, 0, 1, 6, 0, 10)
+
+
+def roll_attacks_batch(
+        n: int,
+        attack_bonus: int,
+        attack_type: AttackType,
+        dmg_count: int,
+        dmg_sides: int,
+        dmg_bonus: int,
+        target_ac: int,
+        max_damage: int | None = None,
+) -> dict[str, Any]:
+    """
+    Roll all attacks for a group of creatures in one vectorized pass.
+
+    Generates every d20 and damage die up front with a single
+    `Generator.integers` call each, then resolves hits, crits, and damage
+    using boolean masks instead of per-attack Python branching.
+
+    Args:
+        n: The number of attacks to roll.
+        attack_bonus: The modifier added to each attack roll.
+        attack_type: The roll type - 'standard', 'advantage', or 'disadvantage'.
+        dmg_count: The number of damage dice per attack (e.g., 2 for 2d6).
+        dmg_sides: The number of sides on each damage die (e.g., 6 for 2d6).
+        dmg_bonus: The flat bonus added to each damage roll.
+        target_ac: The target's armor class to beat.
+        max_damage: Optional precomputed max damage (count * sides + bonus)
+                    for crits, skipping the recomputation per batch.
+
+    Returns:
+        A dictionary of NumPy arrays, each with one entry per attack:
+            - 'dice': (n, 2) matrix of raw d20 rolls (column 0 only for standard).
+            - 'nat_rolls': the selected natural d20 roll per attack.
+            - 'totals': natural roll + attack bonus.
+            - 'crit': boolean mask of natural 20s.
+            - 'crit_fail': boolean mask of natural 1s.
+            - 'hit': boolean mask of attacks that hit.
+            - 'outcome': int8 codes (0 miss, 1 hit, 2 crit, 3 crit fail).
+            - 'damage': final damage dealt per attack (0 for misses).
+            - 'damage_rolls': (n, dmg_count) matrix of normal damage dice.
+            - 'crit_rolls': (n, dmg_count) matrix of extra crit damage dice.
+
+    Example:
+        >>> batch = roll_attacks_batch(5, 4, "standard", 2, 4, 2, 13)
+        >>> batch["nat_rolls"].shape
+        (5,)
+    """
+    # Use the compiled kernel when numba is available
+    if _simulate is not None:
+        (
+            d20s,
+            nat_rolls,
+            totals,
+            damage,
+            damage_rolls,
+            crit_rolls,
+            crit,
+            crit_fail,
+            hit,
+        ) = _simulate(
+            n,
+            attack_bonus,
+            _ATTACK_TYPE_MODE[attack_type],
+            dmg_count,
+            dmg_sides,
+            dmg_bonus,
+            target_ac,
+        )
+
+        # Encode outcomes as small ints for constant-table display lookups
+        outcome: np.ndarray = hit.astype(np.int8)
+        outcome[crit] = OUTCOME_CRIT
+        outcome[crit_fail] = OUTCOME_CRIT_FAIL
+
+        return {
+            "dice": d20s,
+            "nat_rolls": nat_rolls,
+            "totals": totals,
+            "crit": crit,
+            "crit_fail": crit_fail,
+            "hit": hit,
+            "outcome": outcome,
+            "damage": damage,
+            "damage_rolls": damage_rolls,
+            "crit_rolls": crit_rolls,
+        }
+
+    # Draw two d20s per attack; standard attacks use only the first column
+    d20s: np.ndarray = rng.integers(1, D20_SIDES + 1, size=(n, 2))
+
+    # Select the natural roll based on attack type
+    if attack_type == "advantage":
+        # Advantage: take the higher of the two rolls
+        nat_rolls: np.ndarray = d20s.max(axis=1)
+    elif attack_type == "disadvantage":
+        # Disadvantage: take the lower of the two rolls
+        nat_rolls = d20s.min(axis=1)
+    else:
+        # Standard: a single d20 per attack
+        nat_rolls = d20s[:, 0]
+
+    # Total attack values (natural roll + bonus)
+    totals: np.ndarray = nat_rolls + attack_bonus
+
+    # Derive outcome masks: crits auto-hit, crit fails auto-miss
+    crit: np.ndarray = nat_rolls == CRITICAL_HIT
+    crit_fail: np.ndarray = nat_rolls == CRITICAL_MISS
+    hit: np.ndarray = (~crit_fail) & (crit | (totals >= target_ac))
+
+    # Roll the full damage matrix up front - generation is cheap in NumPy
+    # and avoids branch-dependent allocation per hit. int16 dice with an
+    # int32 sum keep the matrices small without risking overflow.
+    damage_rolls: np.ndarray = rng.integers(
+        1, dmg_sides + 1, size=(n, dmg_count), dtype=np.int16
+    )
+    normal_damage: np.ndarray = (
+        damage_rolls.sum(axis=1, dtype=np.int32) + dmg_bonus
+    )
+
+    # Critical hits deal max damage plus an extra roll of the damage dice
+    if max_damage is None:
+        max_damage = dmg_count * dmg_sides + dmg_bonus
+    crit_rolls: np.ndarray = rng.integers(
+        1, dmg_sides + 1, size=(n, dmg_count), dtype=np.int16
+    )
+    crit_extra: np.ndarray = crit_rolls.sum(axis=1, dtype=np.int32) + dmg_bonus
+
+    # Resolve final damage per attack: crit > normal hit > miss (zero)
+    damage: np.ndarray = np.where(
+        crit,
+        max_damage + crit_extra,
+        np.where(hit, normal_damage, 0),
+    )
+
+    # Encode outcomes as small ints for constant-table display lookups
+    outcome: np.ndarray = hit.astype(np.int8)
+    outcome[crit] = OUTCOME_CRIT
+    outcome[crit_fail] = OUTCOME_CRIT_FAIL
+
+    return {
+        "dice": d20s,
+        "nat_rolls": nat_rolls,
+        "totals": totals,
+        "crit": crit,
+        "crit_fail": crit_fail,
+        "hit": hit,
+        "outcome": outcome,
+        "damage": damage,
+        "damage_rolls": damage_rolls,
+        "crit_rolls": crit_rolls,
+    }
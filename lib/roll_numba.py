@@ -0,0 +1,120 @@
+"""
+Numba-compiled attack simulation kernel.
+
+This module compiles the inner dice/attack loop to machine code with
+`@njit(cache=True)` so repeated `!attack` commands run at C speed with
+no Python interpreter overhead. Importing it raises ImportError when
+numba is not installed; callers fall back to the pure-NumPy path.
+"""
+
+import numpy as np
+from numba import njit
+
+# Integer attack-type modes understood by the compiled kernel
+MODE_STANDARD: int = 0
+MODE_ADVANTAGE: int = 1
+MODE_DISADVANTAGE: int = 2
+
+
+@njit(cache=True)
+def simulate(
+        n: int,
+        atk_bonus: int,
+        mode: int,
+        count: int,
+        sides: int,
+        bonus: int,
+        target_ac: int,
+):
+    """
+    Simulate a full batch of attacks in one compiled pass.
+
+    Rolls every d20 and damage die inside a single machine-code loop,
+    resolving advantage/disadvantage, crits, hits, and damage without
+    returning to the interpreter between attacks.
+
+    Args:
+        n: The number of attacks to roll.
+        atk_bonus: The modifier added to each attack roll.
+        mode: Attack type - 0 standard, 1 advantage, 2 disadvantage.
+        count: The number of damage dice per attack (e.g., 2 for 2d6).
+        sides: The number of sides on each damage die (e.g., 6 for 2d6).
+        bonus: The flat bonus added to each damage roll.
+        target_ac: The target's armor class to beat.
+
+    Returns:
+        A tuple of NumPy arrays, each with one entry per attack:
+            - dice: (n, 2) matrix of raw d20 rolls (column 0 for standard).
+            - nat_rolls: the selected natural d20 roll per attack.
+            - totals: natural roll + attack bonus.
+            - damage: final damage dealt per attack (0 for misses).
+            - damage_rolls: (n, count) matrix of normal damage dice.
+            - crit_rolls: (n, count) matrix of extra crit damage dice.
+            - crit_mask: boolean mask of natural 20s.
+            - crit_fail_mask: boolean mask of natural 1s.
+            - hit_mask: boolean mask of attacks that hit.
+    """
+    dice = np.zeros((n, 2), dtype=np.int64)
+    nat_rolls = np.empty(n, dtype=np.int64)
+    totals = np.empty(n, dtype=np.int64)
+    damage = np.zeros(n, dtype=np.int64)
+    damage_rolls = np.empty((n, count), dtype=np.int64)
+    crit_rolls = np.empty((n, count), dtype=np.int64)
+    crit_mask = np.zeros(n, dtype=np.bool_)
+    crit_fail_mask = np.zeros(n, dtype=np.bool_)
+    hit_mask = np.zeros(n, dtype=np.bool_)
+
+    # Maximum possible damage (all dice show max) used for crit damage
+    max_damage = count * sides + bonus
+
+    for i in range(n):
+        # Roll the d20(s) and select based on attack mode
+        roll1 = np.random.randint(1, 21)
+        dice[i, 0] = roll1
+        if mode == MODE_STANDARD:
+            selected = roll1
+        else:
+            roll2 = np.random.randint(1, 21)
+            dice[i, 1] = roll2
+            if mode == MODE_ADVANTAGE:
+                selected = max(roll1, roll2)
+            else:
+                selected = min(roll1, roll2)
+
+        nat_rolls[i] = selected
+        total = selected + atk_bonus
+        totals[i] = total
+
+        # Roll the full damage matrices so callers can format breakdowns
+        normal = bonus
+        extra = bonus
+        for j in range(count):
+            roll = np.random.randint(1, sides + 1)
+            damage_rolls[i, j] = roll
+            normal += roll
+            crit_roll = np.random.randint(1, sides + 1)
+            crit_rolls[i, j] = crit_roll
+            extra += crit_roll
+
+        # Resolve the attack outcome: crits auto-hit, nat 1s auto-miss
+        if selected == 20:
+            crit_mask[i] = True
+            hit_mask[i] = True
+            damage[i] = max_damage + extra
+        elif selected == 1:
+            crit_fail_mask[i] = True
+        elif total >= target_ac:
+            hit_mask[i] = True
+            damage[i] = normal
+
+    return (
+        dice,
+        nat_rolls,
+        totals,
+        damage,
+        damage_rolls,
+        crit_rolls,
+        crit_mask,
+        crit_fail_mask,
+        hit_mask,
+    )
@@ -6,6 +6,9 @@ exposing them as typed constants for use throughout the application.
 """
 
 import os
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from dotenv import load_dotenv
@@ -22,6 +25,67 @@ ConfigDict = dict[str, Any]
 CONFIG: ConfigDict = read("config/config.json")
 CREATURES: ConfigDict = read("config/creatures.json")
 
+# Normalize creature keys to lowercase once so per-command lookups are a
+# single dict access with no per-call string work
+CREATURES = {name.lower(): creature for name, creature in CREATURES.items()}
+
+def _precompute_creature_lookups(creatures: ConfigDict) -> None:
+    """
+    Precompute per-creature lookup helpers on the loaded creature table.
+
+    Stores a lowercase action-name index and frozen damage attributes on
+    each creature/action dict so the attack path avoids repeated .lower()
+    calls and chained dict lookups on every command.
+
+    Args:
+        creatures: The creature table loaded from creatures.json.
+    """
+    for creature in creatures.values():
+        # Lowercase action-name index for case-insensitive action lookups
+        creature["_actions_lower"] = {
+            name.lower(): action for name, action in creature["actions"].items()
+        }
+
+        # Freeze each action's damage spec into a plain (count, sides, bonus)
+        # tuple to avoid three dict lookups per hit in the attack loop
+        for action in creature["actions"].values():
+            damage = action["damage"]
+            action["_dmg"] = (damage["count"], damage["sides"], damage["bonus"])
+
+            # Maximum possible damage (all dice show max), used on crits -
+            # computed once here instead of on every natural 20
+            action["_max_damage"] = (
+                damage["count"] * damage["sides"] + damage["bonus"]
+            )
+
+
+_precompute_creature_lookups(CREATURES)
+
+
+def _intern_keys(data: dict[str, Any]) -> None:
+    """
+    Recursively intern all string keys of a nested configuration dict.
+
+    Interned keys compare by pointer identity on the hash-lookup fast
+    path, so the chained dict accesses in the attack loop avoid full
+    string comparisons.
+
+    Args:
+        data: The dictionary whose keys (and nested dict keys) to intern.
+    """
+    for _key in list(data):
+        _value = data.pop(_key)
+        if isinstance(_value, dict):
+            _intern_keys(_value)
+        data[sys.intern(_key) if isinstance(_key, str) else _key] = _value
+
+
+_intern_keys(CREATURES)
+
+# Freeze the creature table: it is never mutated after load, and the
+# read-only proxy makes accidental writes fail loudly
+CREATURES: Mapping[str, Any] = MappingProxyType(CREATURES)
+
 # Discord API settings - Read from environment variable
 DISCORD_TOKEN: str = os.getenv("DISCORD_TOKEN", "")
 
@@ -29,10 +93,11 @@ DISCORD_TOKEN: str = os.getenv("DISCORD_TOKEN", "")
 PREFIX: str = CONFIG["commands"]["prefix"]
 ROLL_COMMAND: str = CONFIG["commands"]["roll"]
 
-# Attack type command identifiers
-STANDARD_ATTACK_COMMAND: str = CONFIG["attacks"]["standard"]
-ADVANTAGE_ATTACK_COMMAND: str = CONFIG["attacks"]["advantage"]
-DISADVANTAGE_ATTACK_COMMAND: str = CONFIG["attacks"]["disadvantage"]
+# Attack type command identifiers, interned so membership tests against
+# them hit the identity-compare fast path
+STANDARD_ATTACK_COMMAND: str = sys.intern(CONFIG["attacks"]["standard"])
+ADVANTAGE_ATTACK_COMMAND: str = sys.intern(CONFIG["attacks"]["advantage"])
+DISADVANTAGE_ATTACK_COMMAND: str = sys.intern(CONFIG["attacks"]["disadvantage"])
 
 # Validate required configuration
 if not DISCORD_TOKEN: